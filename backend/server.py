@@ -1,29 +1,60 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Request, Response, status
+from fastapi.responses import HTMLResponse, ORJSONResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ReturnDocument, UpdateOne
+from pymongo.errors import DuplicateKeyError
 import os
+import asyncio
+import base64
+import hashlib
+import hmac
 import logging
+import time
 from pathlib import Path
-from pydantic import BaseModel, Field
-from typing import List, Optional
+from pydantic import BaseModel, BeforeValidator, Field, PlainSerializer
+from typing import Annotated, List, Optional
+from enum import IntEnum
 import uuid
 from datetime import datetime, timedelta, timezone
 import bcrypt
-import jwt
-from passlib.context import CryptContext
+import orjson
+from cachetools import TTLCache
 
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
 # MongoDB connection
 mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
+# One client per process; Motor multiplexes requests over its connection pool.
+# tz_aware so BSON datetimes come back as UTC-aware (serialized with a Z suffix);
+# uuidRepresentation so uuid.UUID ids are stored as 16-byte BSON UUIDs (subtype 4).
+mongo_client_options = dict(
+    tz_aware=True,
+    uuidRepresentation='standard',
+    maxPoolSize=int(os.environ.get('MONGO_MAX_POOL_SIZE', '200')),
+    minPoolSize=int(os.environ.get('MONGO_MIN_POOL_SIZE', '20')),
+    serverSelectionTimeoutMS=int(os.environ.get('MONGO_SERVER_SELECTION_TIMEOUT_MS', '3000')),
+    retryWrites=True,
+)
+# Wire compression only pays off across a WAN; e.g. MONGO_COMPRESSORS=zstd,snappy,zlib
+if os.environ.get('MONGO_COMPRESSORS'):
+    mongo_client_options['compressors'] = os.environ['MONGO_COMPRESSORS']
+client = AsyncIOMotorClient(mongo_url, **mongo_client_options)
 db = client[os.environ['DB_NAME']]
 
+class UTCJSONResponse(ORJSONResponse):
+    """ORJSONResponse that writes UTC datetimes with a Z suffix, matching the
+    pydantic-serialized models, so raw Mongo documents use the same format"""
+    def render(self, content) -> bytes:
+        return orjson.dumps(
+            content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_UTC_Z
+        )
+
 # Create the main app without a prefix
-app = FastAPI()
+app = FastAPI(default_response_class=UTCJSONResponse)
 
 # Create a router with the /api prefix
 api_router = APIRouter(prefix="/api")
@@ -32,17 +63,60 @@ api_router = APIRouter(prefix="/api")
 SECRET_KEY = "your-secret-key-here-change-in-production"
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
+# Encoded once rather than on every token signature
+SECRET_KEY_BYTES = SECRET_KEY.encode("utf-8")
 
-# Password hashing
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# Authenticated-user cache: user_id -> User, saves a Mongo round-trip per request.
+# Entries are refreshed on profile updates; the TTL bounds staleness across workers.
+USER_CACHE_TTL_SECONDS = 60
+user_cache = TTLCache(maxsize=10_000, ttl=USER_CACHE_TTL_SECONDS)
+
+# Never read password hashes (or Mongo's _id) back out unless a handler needs them
+USER_PROJECTION = {"_id": 0, "password": 0}
+# completed_student_ids is internal bookkeeping for completion lookups
+ASSIGNMENT_PROJECTION = {"_id": 0, "completed_student_ids": 0}
+
+# Password hashing (native bcrypt binding, compatible with existing $2b$ hashes)
 security = HTTPBearer()
 
 # Helper functions
 def verify_password(plain_password, hashed_password):
-    return pwd_context.verify(plain_password, hashed_password)
+    return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
 
 def get_password_hash(password):
-    return pwd_context.hash(password)
+    return bcrypt.hashpw(password.encode("utf-8"), bcrypt.gensalt()).decode("utf-8")
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match uses weak comparison: it may list several tags, proxies that
+    re-encode a response send them back as W/"...", and * matches any tag"""
+    if not if_none_match:
+        return False
+    tags = [tag.strip() for tag in if_none_match.split(",")]
+    return "*" in tags or any(tag.removeprefix("W/") == etag for tag in tags)
+
+def etag_response(request: Request, content):
+    """Serialize content with an ETag; answer a matching If-None-Match with 304"""
+    body = orjson.dumps(content, option=orjson.OPT_UTC_Z)
+    etag = f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+    # no-cache still lets clients reuse their copy, but only after revalidating,
+    # so a newly created assignment shows up on the next request
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+def _b64url_encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+def _b64url_decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+# Every token this server issues shares the same header, so it is encoded once.
+# Byte-identical to PyJWT's header, so tokens issued before the switch stay valid.
+JWT_HEADER_B64 = _b64url_encode(orjson.dumps({"alg": ALGORITHM, "typ": "JWT"}))
+
+def _jwt_signature(signing_input: bytes) -> bytes:
+    return hmac.new(SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
 
 def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
     to_encode = data.copy()
@@ -50,29 +124,73 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
         expire = datetime.now(timezone.utc) + expires_delta
     else:
         expire = datetime.now(timezone.utc) + timedelta(minutes=15)
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
-    return encoded_jwt
+    to_encode.update({"exp": int(expire.timestamp())})
+    signing_input = JWT_HEADER_B64 + b"." + _b64url_encode(orjson.dumps(to_encode))
+    encoded_jwt = signing_input + b"." + _b64url_encode(_jwt_signature(signing_input))
+    return encoded_jwt.decode("ascii")
+
+def decode_access_token(token: str) -> dict:
+    """Verify a token from create_access_token and return its claims.
+    
+    Raises ValueError if the token is malformed, has a bad signature or has expired.
+    """
+    signing_input, _, signature = token.encode("ascii").rpartition(b".")
+    header, _, payload = signing_input.partition(b".")
+    if header != JWT_HEADER_B64:
+        raise ValueError("Unsupported token header")
+    if not hmac.compare_digest(_b64url_decode(signature), _jwt_signature(signing_input)):
+        raise ValueError("Invalid token signature")
+    claims = orjson.loads(_b64url_decode(payload))
+    if not isinstance(claims, dict) or not isinstance(claims.get("exp"), (int, float)):
+        raise ValueError("Invalid token claims")
+    if claims["exp"] <= time.time():
+        raise ValueError("Token has expired")
+    return claims
 
 async def get_current_user(credentials: HTTPAuthorizationCredentials = Depends(security)):
     try:
-        payload = jwt.decode(credentials.credentials, SECRET_KEY, algorithms=[ALGORITHM])
-        user_id: str = payload.get("sub")
-        if user_id is None:
+        payload = decode_access_token(credentials.credentials)
+        subject: str = payload.get("sub")
+        if subject is None:
             raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-        user = await db.users.find_one({"id": user_id})
+        user_id = uuid.UUID(subject)
+        user = user_cache.get(user_id)
         if user is None:
-            raise HTTPException(status_code=401, detail="User not found")
-        return User(**user)
-    except jwt.PyJWTError:
+            user_data = await db.users.find_one({"id": user_id}, USER_PROJECTION)
+            if user_data is None:
+                raise HTTPException(status_code=401, detail="User not found")
+            # Trusted data we wrote ourselves: skip re-validation. setdefault keeps
+            # an entry a concurrent profile update stored while this read was in flight
+            user = user_cache.setdefault(user_id, User.model_construct(**user_data))
+        return user
+    except ValueError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
 
 # Define Models
+class Role(IntEnum):
+    student = 0
+    teacher = 1
+
+def _parse_role(value):
+    if isinstance(value, str):
+        try:
+            return Role[value]
+        except KeyError:
+            raise ValueError(f"role must be one of: {', '.join(Role.__members__)}")
+    return value
+
+# Stored as a small int in Mongo, exposed as "student"/"teacher" in the API
+RoleField = Annotated[
+    Role,
+    BeforeValidator(_parse_role),
+    PlainSerializer(lambda role: Role(role).name, return_type=str, when_used="json"),
+]
+
 class User(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
     name: str
     email: str
-    role: str  # "teacher" or "student"
+    role: RoleField
     profile_photo: Optional[str] = None
     theme_preference: str = "light"  # "light" or "dark"
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
@@ -81,7 +199,7 @@ class UserCreate(BaseModel):
     name: str
     email: str
     password: str
-    role: str
+    role: RoleField
 
 class UserUpdate(BaseModel):
     name: Optional[str] = None
@@ -93,14 +211,14 @@ class UserLogin(BaseModel):
     password: str
 
 class Assignment(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
     title: str
     description: str
     subject: str
     deadline: datetime
-    teacher_id: str
+    teacher_id: uuid.UUID
     teacher_name: str
-    assigned_students: List[str] = []  # List of student IDs assigned to this assignment
+    assigned_students: List[uuid.UUID] = []  # List of student IDs assigned to this assignment
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
 class AssignmentCreate(BaseModel):
@@ -108,12 +226,15 @@ class AssignmentCreate(BaseModel):
     description: str
     subject: str
     deadline: datetime
-    assigned_students: List[str] = []  # Optional list of student IDs to assign
+    assigned_students: List[uuid.UUID] = []  # Optional list of student IDs to assign
+
+class AssignmentWithStatus(Assignment):
+    completed: bool = False  # Whether the requesting student has completed it
 
 class AssignmentSubmission(BaseModel):
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
-    assignment_id: str
-    student_id: str
+    id: uuid.UUID = Field(default_factory=uuid.uuid4)
+    assignment_id: uuid.UUID
+    student_id: uuid.UUID
     student_name: str
     completed_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     status: str = "completed"
@@ -123,34 +244,16 @@ class Token(BaseModel):
     token_type: str
     user: User
 
-# Helper function to prepare data for MongoDB
-def prepare_for_mongo(data):
-    if isinstance(data, dict):
-        for key, value in data.items():
-            if isinstance(value, datetime):
-                data[key] = value.isoformat()
-    return data
-
-def parse_from_mongo(item):
-    if isinstance(item, dict):
-        for key, value in item.items():
-            if isinstance(value, str) and key in ['created_at', 'deadline', 'completed_at']:
-                try:
-                    item[key] = datetime.fromisoformat(value.replace('Z', '+00:00'))
-                except:
-                    pass
-    return item
-
 # Authentication Routes
 @api_router.post("/auth/register", response_model=Token)
 async def register(user_data: UserCreate):
-    # Check if user already exists
-    existing_user = await db.users.find_one({"email": user_data.email})
+    # Check if user already exists before paying for a bcrypt hash
+    existing_user = await db.users.find_one({"email": user_data.email}, {"_id": 1})
     if existing_user:
         raise HTTPException(status_code=400, detail="Email already registered")
     
-    # Hash password
-    hashed_password = get_password_hash(user_data.password)
+    # Hash off the event loop (bcrypt releases the GIL)
+    hashed_password = await asyncio.to_thread(get_password_hash, user_data.password)
     
     # Create user
     user = User(
@@ -159,16 +262,19 @@ async def register(user_data: UserCreate):
         role=user_data.role
     )
     
-    user_dict = user.dict()
+    user_dict = user.model_dump()
     user_dict["password"] = hashed_password
-    user_dict = prepare_for_mongo(user_dict)
     
-    await db.users.insert_one(user_dict)
+    try:
+        await db.users.insert_one(user_dict)
+    except DuplicateKeyError:
+        # Lost a race with a concurrent registration for the same email
+        raise HTTPException(status_code=400, detail="Email already registered")
     
     # Create access token
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer", "user": user}
@@ -176,45 +282,49 @@ async def register(user_data: UserCreate):
 @api_router.post("/auth/login", response_model=Token)
 async def login(user_credentials: UserLogin):
     user_data = await db.users.find_one({"email": user_credentials.email})
-    if not user_data or not verify_password(user_credentials.password, user_data["password"]):
+    if not user_data or not await asyncio.to_thread(
+        verify_password, user_credentials.password, user_data["password"]
+    ):
         raise HTTPException(status_code=401, detail="Incorrect email or password")
     
-    user_data = parse_from_mongo(user_data)
-    user = User(**{k: v for k, v in user_data.items() if k != "password"})
+    user = User.model_construct(**{k: v for k, v in user_data.items() if k != "password"})
     
     access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        data={"sub": user.id}, expires_delta=access_token_expires
+        data={"sub": str(user.id)}, expires_delta=access_token_expires
     )
     
     return {"access_token": access_token, "token_type": "bearer", "user": user}
 
 # User Profile Routes
 @api_router.get("/users/me", response_model=User)
-async def get_current_user_profile(current_user: User = Depends(get_current_user)):
-    return current_user
+async def get_current_user_profile(request: Request, current_user: User = Depends(get_current_user)):
+    return etag_response(request, current_user.model_dump(mode="json"))
 
 @api_router.put("/users/me", response_model=User)
 async def update_profile(user_update: UserUpdate, current_user: User = Depends(get_current_user)):
-    update_data = {k: v for k, v in user_update.dict().items() if v is not None}
+    update_data = user_update.model_dump(exclude_none=True)
     
     if update_data:
-        await db.users.update_one(
+        # Update and read back the updated user in a single round-trip
+        updated_user_data = await db.users.find_one_and_update(
             {"id": current_user.id},
-            {"$set": update_data}
+            {"$set": update_data},
+            projection=USER_PROJECTION,
+            return_document=ReturnDocument.AFTER
         )
-        
-        # Get updated user
-        updated_user_data = await db.users.find_one({"id": current_user.id})
-        updated_user_data = parse_from_mongo(updated_user_data)
-        return User(**{k: v for k, v in updated_user_data.items() if k != "password"})
+        updated_user = User.model_construct(**updated_user_data)
+        # Store the fresh copy rather than just dropping the entry, so a read that
+        # raced with this update can't put the pre-update user back
+        user_cache[current_user.id] = updated_user
+        return updated_user
     
     return current_user
 
 # Assignment Routes
 @api_router.post("/assignments", response_model=Assignment)
 async def create_assignment(assignment_data: AssignmentCreate, current_user: User = Depends(get_current_user)):
-    if current_user.role != "teacher":
+    if current_user.role != Role.teacher:
         raise HTTPException(status_code=403, detail="Only teachers can create assignments")
     
     assignment = Assignment(
@@ -227,114 +337,191 @@ async def create_assignment(assignment_data: AssignmentCreate, current_user: Use
         assigned_students=assignment_data.assigned_students
     )
     
-    assignment_dict = prepare_for_mongo(assignment.dict())
-    await db.assignments.insert_one(assignment_dict)
+    await db.assignments.insert_one(assignment.model_dump())
     
     return assignment
 
+@api_router.post("/assignments/bulk", response_model=List[Assignment])
+async def create_assignments_bulk(assignments_data: List[AssignmentCreate], current_user: User = Depends(get_current_user)):
+    """Create many assignments in one request with a single insert_many round-trip"""
+    if current_user.role != Role.teacher:
+        raise HTTPException(status_code=403, detail="Only teachers can create assignments")
+    
+    assignments = [
+        Assignment(
+            title=assignment_data.title,
+            description=assignment_data.description,
+            subject=assignment_data.subject,
+            deadline=assignment_data.deadline,
+            teacher_id=current_user.id,
+            teacher_name=current_user.name,
+            assigned_students=assignment_data.assigned_students
+        )
+        for assignment_data in assignments_data
+    ]
+    
+    if assignments:
+        await db.assignments.insert_many(
+            [assignment.model_dump() for assignment in assignments], ordered=False
+        )
+    
+    return assignments
+
 @api_router.get("/assignments", response_model=List[Assignment])
-async def get_all_assignments(current_user: User = Depends(get_current_user)):
+async def get_all_assignments(request: Request, current_user: User = Depends(get_current_user)):
     """Get all assignments for both teachers and students"""
-    assignments_data = await db.assignments.find().to_list(1000)
-    assignments = []
-    for assignment_data in assignments_data:
-        assignment_data = parse_from_mongo(assignment_data)
-        assignments.append(Assignment(**assignment_data))
-    return assignments
+    # Stored documents already match the Assignment schema, so they are
+    # serialized directly instead of being re-validated row by row
+    assignments_data = await db.assignments.find({}, ASSIGNMENT_PROJECTION).to_list(1000)
+    return etag_response(request, assignments_data)
 
 @api_router.get("/assignments/my", response_model=List[Assignment])
 async def get_my_assignments(current_user: User = Depends(get_current_user)):
     """Get user's specific assignments - teacher's created assignments or student's assigned assignments"""
-    if current_user.role == "teacher":
+    if current_user.role == Role.teacher:
         # Teachers see assignments they created
-        assignments_data = await db.assignments.find({"teacher_id": current_user.id}).to_list(1000)
+        query = {"teacher_id": current_user.id}
     else:
         # Students see assignments they are specifically assigned to
-        assignments_data = await db.assignments.find({"assigned_students": current_user.id}).to_list(1000)
+        query = {"assigned_students": current_user.id}
     
-    assignments = []
-    for assignment_data in assignments_data:
-        assignment_data = parse_from_mongo(assignment_data)
-        assignments.append(Assignment(**assignment_data))
-    return assignments
+    assignments_data = await db.assignments.find(query, ASSIGNMENT_PROJECTION).to_list(1000)
+    return UTCJSONResponse(assignments_data)
+
+@api_router.get("/assignments/my/status", response_model=List[AssignmentWithStatus])
+async def get_my_assignments_with_status(current_user: User = Depends(get_current_user)):
+    """Get a student's assigned assignments, each annotated with its completion status"""
+    if current_user.role != Role.student:
+        raise HTTPException(status_code=403, detail="Only students can view assignment status")
+    
+    # Completion is denormalized onto the assignment, so no submissions join is needed
+    pipeline = [
+        {"$match": {"assigned_students": current_user.id}},
+        {"$addFields": {"completed": {
+            "$in": [current_user.id, {"$ifNull": ["$completed_student_ids", []]}]
+        }}},
+        {"$project": ASSIGNMENT_PROJECTION}
+    ]
+    assignments_data = await db.assignments.aggregate(pipeline).to_list(1000)
+    return UTCJSONResponse(assignments_data)
 
 # Get all students (for assignment creation)
 @api_router.get("/users/students", response_model=List[User])
 async def get_all_students(current_user: User = Depends(get_current_user)):
     """Get all students for assignment creation"""
-    if current_user.role != "teacher":
+    if current_user.role != Role.teacher:
         raise HTTPException(status_code=403, detail="Only teachers can view student list")
     
-    students_data = await db.users.find({"role": "student"}).to_list(1000)
-    students = []
-    for student_data in students_data:
-        student_data = parse_from_mongo(student_data)
-        students.append(User(**{k: v for k, v in student_data.items() if k != "password"}))
-    return students
+    # Roles are stored as ints; rename in the pipeline to keep the API's string roles
+    pipeline = [
+        {"$match": {"role": Role.student}},
+        {"$project": USER_PROJECTION},
+        {"$set": {"role": Role.student.name}}
+    ]
+    students_data = await db.users.aggregate(pipeline).to_list(1000)
+    return UTCJSONResponse(students_data)
 
 # Assignment Submission Routes
 @api_router.post("/assignments/{assignment_id}/complete")
-async def complete_assignment(assignment_id: str, current_user: User = Depends(get_current_user)):
-    if current_user.role != "student":
+async def complete_assignment(assignment_id: uuid.UUID, current_user: User = Depends(get_current_user)):
+    if current_user.role != Role.student:
         raise HTTPException(status_code=403, detail="Only students can complete assignments")
     
-    # Check if assignment exists
-    assignment = await db.assignments.find_one({"id": assignment_id})
-    if not assignment:
-        raise HTTPException(status_code=404, detail="Assignment not found")
-    
-    # Check if student is assigned to this assignment
-    if current_user.id not in assignment.get("assigned_students", []):
+    # Record the completion on the assignment; only matches if the student is
+    # assigned and has not completed it yet
+    result = await db.assignments.update_one(
+        {
+            "id": assignment_id,
+            "assigned_students": current_user.id,
+            "completed_student_ids": {"$ne": current_user.id}
+        },
+        {"$addToSet": {"completed_student_ids": current_user.id}}
+    )
+    if result.modified_count == 0:
+        # Work out why nothing matched. Both lookups filter on indexed fields and
+        # return only _id, so the roster is never transferred; the common case
+        # (an assigned student completing twice) is answered by the first one
+        if await db.assignments.find_one(
+            {"id": assignment_id, "assigned_students": current_user.id}, {"_id": 1}
+        ):
+            raise HTTPException(status_code=400, detail="Assignment already completed")
+        
+        if not await db.assignments.find_one({"id": assignment_id}, {"_id": 1}):
+            raise HTTPException(status_code=404, detail="Assignment not found")
+        
         raise HTTPException(status_code=403, detail="You are not assigned to this assignment")
     
-    # Check if already completed
-    existing_submission = await db.submissions.find_one({
-        "assignment_id": assignment_id,
-        "student_id": current_user.id
-    })
-    if existing_submission:
-        raise HTTPException(status_code=400, detail="Assignment already completed")
-    
-    # Create submission
+    # Create submission; the unique (assignment_id, student_id) index also
+    # rejects completions recorded before completed_student_ids existed
     submission = AssignmentSubmission(
         assignment_id=assignment_id,
         student_id=current_user.id,
         student_name=current_user.name
     )
     
-    submission_dict = prepare_for_mongo(submission.dict())
-    await db.submissions.insert_one(submission_dict)
+    try:
+        await db.submissions.insert_one(submission.model_dump())
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Assignment already completed")
+    except Exception:
+        # Undo the completion recorded above so the student can retry instead of
+        # being stuck as "already completed" with no submission on record
+        await db.assignments.update_one(
+            {"id": assignment_id},
+            {"$pull": {"completed_student_ids": current_user.id}}
+        )
+        raise
     
     return {"message": "Assignment marked as completed successfully"}
 
 @api_router.get("/assignments/{assignment_id}/submissions")
-async def get_assignment_submissions(assignment_id: str, current_user: User = Depends(get_current_user)):
-    if current_user.role != "teacher":
+async def get_assignment_submissions(assignment_id: uuid.UUID, current_user: User = Depends(get_current_user)):
+    if current_user.role != Role.teacher:
         raise HTTPException(status_code=403, detail="Only teachers can view submissions")
     
-    submissions_data = await db.submissions.find({"assignment_id": assignment_id}).to_list(1000)
-    submissions = []
-    for submission_data in submissions_data:
-        submission_data = parse_from_mongo(submission_data)
-        submissions.append(AssignmentSubmission(**submission_data))
-    return submissions
+    submissions_data = await db.submissions.find({"assignment_id": assignment_id}, {"_id": 0}).to_list(1000)
+    return UTCJSONResponse(submissions_data)
 
 @api_router.get("/submissions/my")
 async def get_my_submissions(current_user: User = Depends(get_current_user)):
-    if current_user.role != "student":
+    if current_user.role != Role.student:
         raise HTTPException(status_code=403, detail="Only students can view their submissions")
     
-    submissions_data = await db.submissions.find({"student_id": current_user.id}).to_list(1000)
-    completed_assignment_ids = [sub["assignment_id"] for sub in submissions_data]
+    # Collect the ids into one sorted array server-side instead of one document per row
+    pipeline = [
+        {"$match": {"completed_student_ids": current_user.id}},
+        {"$sort": {"id": 1}},
+        {"$group": {"_id": None, "ids": {"$push": "$id"}}}
+    ]
+    result = await db.assignments.aggregate(pipeline).to_list(1)
+    completed_assignment_ids = result[0]["ids"] if result else []
     return {"completed_assignments": completed_assignment_ids}
 
 # Include the router in the main app
 app.include_router(api_router)
 
+# Opt-in profiling: with PROFILING_ENABLED=true, any request sent with an
+# X-Profile header returns a pyinstrument HTML report instead of its response
+if os.environ.get('PROFILING_ENABLED', 'false').lower() == 'true':
+    from pyinstrument import Profiler
+
+    @app.middleware("http")
+    async def profile_request(request: Request, call_next):
+        if not request.headers.get("X-Profile"):
+            return await call_next(request)
+        profiler = Profiler(interval=0.001, async_mode="enabled")
+        profiler.start()
+        await call_next(request)
+        profiler.stop()
+        return HTMLResponse(profiler.output_html())
+
+# Parsed once at startup. Credentials are only allowed with an explicit origin
+# list: a wildcard with credentials is unsafe, and auth uses bearer tokens anyway.
+cors_origins = [origin.strip() for origin in os.environ.get('CORS_ORIGINS', '*').split(',') if origin.strip()]
 app.add_middleware(
     CORSMiddleware,
-    allow_credentials=True,
-    allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
+    allow_credentials=bool(cors_origins) and '*' not in cors_origins,
+    allow_origins=cors_origins,
     allow_methods=["*"],
     allow_headers=["*"],
 )
@@ -346,6 +533,129 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+@app.on_event("startup")
+async def create_indexes():
+    await db.users.create_index("email", unique=True)
+    await db.users.create_index("id", unique=True)
+    await db.users.create_index("role")
+    await db.assignments.create_index("id", unique=True)
+    await db.assignments.create_index("teacher_id")
+    await db.assignments.create_index("assigned_students")
+    await db.assignments.create_index("completed_student_ids")
+    await db.submissions.create_index(
+        [("assignment_id", 1), ("student_id", 1)], unique=True
+    )
+    await db.submissions.create_index("student_id")
+
+@app.on_event("startup")
+async def migrate_string_roles():
+    """Rewrite "student"/"teacher" role strings as Role ints (idempotent)"""
+    for role in Role:
+        await db.users.update_many({"role": role.name}, {"$set": {"role": role}})
+
+# Fields holding ids, which older documents store as 36-character strings
+ID_FIELDS = {
+    "users": ["id"],
+    "assignments": ["id", "teacher_id", "assigned_students", "completed_student_ids"],
+    "submissions": ["id", "assignment_id", "student_id"],
+}
+
+def _as_uuid(value):
+    return uuid.UUID(value) if isinstance(value, str) else value
+
+# One-off data migrations record a marker in the migrations collection when
+# done, so later boots skip their full-collection scans. Workers racing on the
+# first boot are harmless since every migration is idempotent.
+async def _migration_applied(name):
+    return await db.migrations.find_one({"_id": name}, {"_id": 1}) is not None
+
+async def _mark_migration_applied(name):
+    await db.migrations.update_one(
+        {"_id": name}, {"$set": {"applied_at": datetime.now(timezone.utc)}}, upsert=True
+    )
+
+@app.on_event("startup")
+async def migrate_string_ids():
+    """Rewrite string ids as BSON UUIDs, once per database"""
+    if await _migration_applied("migrate_string_ids"):
+        return
+    for collection_name, fields in ID_FIELDS.items():
+        collection = db[collection_name]
+        query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+        updates = []
+        async for doc in collection.find(query, {field: 1 for field in fields}):
+            changes = {
+                field: [_as_uuid(v) for v in doc[field]] if isinstance(doc[field], list) else _as_uuid(doc[field])
+                for field in fields if field in doc
+            }
+            updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+        if updates:
+            await collection.bulk_write(updates, ordered=False)
+    await _mark_migration_applied("migrate_string_ids")
+
+# Datetime fields, which older documents store as ISO-8601 strings
+DATE_FIELDS = {
+    "users": ["created_at"],
+    "assignments": ["created_at", "deadline"],
+    "submissions": ["completed_at"],
+}
+
+def _as_datetime(value):
+    parsed = datetime.fromisoformat(value)
+    # Naive strings were written from datetime.utcnow()
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+@app.on_event("startup")
+async def migrate_string_dates():
+    """Rewrite ISO-string datetimes as BSON dates, once per database.
+    
+    Unparsable strings are logged and left as they are rather than stopping startup.
+    """
+    if await _migration_applied("migrate_string_dates"):
+        return
+    for collection_name, fields in DATE_FIELDS.items():
+        collection = db[collection_name]
+        query = {"$or": [{field: {"$type": "string"}} for field in fields]}
+        updates = []
+        async for doc in collection.find(query, {field: 1 for field in fields}):
+            changes = {}
+            for field in fields:
+                if not isinstance(doc.get(field), str):
+                    continue
+                try:
+                    changes[field] = _as_datetime(doc[field])
+                except ValueError:
+                    logger.warning("Skipping unparsable %s.%s on %s: %r", collection_name, field, doc["_id"], doc[field])
+            if changes:
+                updates.append(UpdateOne({"_id": doc["_id"]}, {"$set": changes}))
+        if updates:
+            await collection.bulk_write(updates, ordered=False)
+    await _mark_migration_applied("migrate_string_dates")
+
+@app.on_event("startup")
+async def backfill_completed_student_ids():
+    """Fold submissions into assignments.completed_student_ids, once per database.
+    
+    complete_assignment keeps the field current for every later completion, so
+    only submissions written before it existed need folding in.
+    """
+    if await _migration_applied("backfill_completed_student_ids"):
+        return
+    pipeline = [
+        {"$group": {"_id": "$assignment_id", "student_ids": {"$addToSet": "$student_id"}}},
+        {"$project": {"_id": 0, "id": "$_id", "student_ids": 1}},
+        {"$merge": {
+            "into": "assignments",
+            "on": "id",
+            "whenMatched": [{"$set": {"completed_student_ids": {"$setUnion": [
+                {"$ifNull": ["$completed_student_ids", []]}, "$$new.student_ids"
+            ]}}}],
+            "whenNotMatched": "discard"
+        }}
+    ]
+    await db.submissions.aggregate(pipeline).to_list(None)
+    await _mark_migration_applied("backfill_completed_student_ids")
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
     client.close()
\ No newline at end of file
@@ -6,15 +6,30 @@ Using local backend for testing due to external URL timeout issues
 """
 
 import requests
-import json
 from datetime import datetime, timedelta, timezone
-import uuid
+import itertools
+import secrets
 
 # Configuration - Using localhost for testing
 BASE_URL = "http://localhost:8001/api"
 HEADERS = {"Content-Type": "application/json"}
 TIMEOUT = 10
 
+# Endpoint URLs, built once at import
+REGISTER_URL = f"{BASE_URL}/auth/register"
+LOGIN_URL = f"{BASE_URL}/auth/login"
+ME_URL = f"{BASE_URL}/users/me"
+ASSIGNMENTS_URL = f"{BASE_URL}/assignments"
+MY_ASSIGNMENTS_URL = f"{BASE_URL}/assignments/my"
+MY_SUBMISSIONS_URL = f"{BASE_URL}/submissions/my"
+
+# Unique email suffixes: one random prefix per run plus a process-local counter
+_RUN_ID = secrets.token_hex(4)
+_uid = itertools.count()
+
+def _unique_suffix():
+    return f"{_RUN_ID}{next(_uid):x}"
+
 class TestResults:
     def __init__(self):
         self.passed = 0
@@ -47,21 +62,21 @@ def test_user_authentication():
     # Test data with realistic information
     teacher_data = {
         "name": "Dr. Sarah Johnson",
-        "email": f"sarah.johnson.{uuid.uuid4().hex[:8]}@university.edu",
+        "email": f"sarah.johnson.{_unique_suffix()}@university.edu",
         "password": "SecurePass123!",
         "role": "teacher"
     }
     
     student_data = {
         "name": "Alex Chen",
-        "email": f"alex.chen.{uuid.uuid4().hex[:8]}@student.edu", 
+        "email": f"alex.chen.{_unique_suffix()}@student.edu", 
         "password": "StudentPass456!",
         "role": "student"
     }
     
     # Test teacher registration
     try:
-        response = requests.post(f"{BASE_URL}/auth/register", 
+        response = requests.post(REGISTER_URL, 
                                json=teacher_data, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 200:
             data = response.json()
@@ -84,7 +99,7 @@ def test_user_authentication():
     
     # Test student registration
     try:
-        response = requests.post(f"{BASE_URL}/auth/register", 
+        response = requests.post(REGISTER_URL, 
                                json=student_data, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 200:
             data = response.json()
@@ -107,7 +122,7 @@ def test_user_authentication():
     
     # Test duplicate email registration
     try:
-        response = requests.post(f"{BASE_URL}/auth/register", 
+        response = requests.post(REGISTER_URL, 
                                json=teacher_data, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 400:
             results.log_success("Duplicate Email Prevention")
@@ -119,7 +134,7 @@ def test_user_authentication():
     # Test teacher login
     try:
         login_data = {"email": teacher_data["email"], "password": teacher_data["password"]}
-        response = requests.post(f"{BASE_URL}/auth/login", 
+        response = requests.post(LOGIN_URL, 
                                json=login_data, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 200:
             data = response.json()
@@ -139,7 +154,7 @@ def test_user_authentication():
     # Test student login
     try:
         login_data = {"email": student_data["email"], "password": student_data["password"]}
-        response = requests.post(f"{BASE_URL}/auth/login", 
+        response = requests.post(LOGIN_URL, 
                                json=login_data, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 200:
             data = response.json()
@@ -159,7 +174,7 @@ def test_user_authentication():
     # Test invalid credentials
     try:
         invalid_login = {"email": teacher_data["email"], "password": "wrongpassword"}
-        response = requests.post(f"{BASE_URL}/auth/login", 
+        response = requests.post(LOGIN_URL, 
                                json=invalid_login, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code == 401:
             results.log_success("Invalid Credentials Rejection")
@@ -178,7 +193,7 @@ def test_user_profile_management(teacher_token, student_token):
     if teacher_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.get(f"{BASE_URL}/users/me", headers=auth_headers, timeout=TIMEOUT)
+            response = requests.get(ME_URL, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 if "id" in data and "name" in data and "role" in data:
@@ -199,7 +214,7 @@ def test_user_profile_management(teacher_token, student_token):
                 "profile_photo": "https://example.com/photo.jpg"
             }
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.put(f"{BASE_URL}/users/me", 
+            response = requests.put(ME_URL, 
                                   json=update_data, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
@@ -214,7 +229,7 @@ def test_user_profile_management(teacher_token, student_token):
     
     # Test unauthorized access
     try:
-        response = requests.get(f"{BASE_URL}/users/me", headers=HEADERS, timeout=TIMEOUT)
+        response = requests.get(ME_URL, headers=HEADERS, timeout=TIMEOUT)
         if response.status_code in [401, 403]:
             results.log_success("Unauthorized Profile Access Prevention")
         else:
@@ -239,7 +254,7 @@ def test_assignment_management(teacher_token, student_token):
                 "deadline": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
             }
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.post(f"{BASE_URL}/assignments", 
+            response = requests.post(ASSIGNMENTS_URL, 
                                    json=assignment_data, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
@@ -263,7 +278,7 @@ def test_assignment_management(teacher_token, student_token):
                 "deadline": (datetime.now(timezone.utc) + timedelta(days=1)).isoformat()
             }
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.post(f"{BASE_URL}/assignments", 
+            response = requests.post(ASSIGNMENTS_URL, 
                                    json=assignment_data, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 403:
                 results.log_success("Assignment Creation Prevention (Student)")
@@ -276,7 +291,7 @@ def test_assignment_management(teacher_token, student_token):
     if student_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.get(f"{BASE_URL}/assignments", headers=auth_headers, timeout=TIMEOUT)
+            response = requests.get(ASSIGNMENTS_URL, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, list):
@@ -292,7 +307,7 @@ def test_assignment_management(teacher_token, student_token):
     if teacher_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.get(f"{BASE_URL}/assignments/my", headers=auth_headers, timeout=TIMEOUT)
+            response = requests.get(MY_ASSIGNMENTS_URL, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 if isinstance(data, list):
@@ -308,7 +323,7 @@ def test_assignment_management(teacher_token, student_token):
     if student_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.get(f"{BASE_URL}/assignments/my", headers=auth_headers, timeout=TIMEOUT)
+            response = requests.get(MY_ASSIGNMENTS_URL, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 403:
                 results.log_success("Teacher Assignments Access Prevention (Student)")
             else:
@@ -326,11 +341,14 @@ def test_assignment_completion(student_token, teacher_token, assignment_id):
         results.log_failure("Assignment Completion Tests", "No assignment ID available from previous tests")
         return results
     
+    complete_url = f"{ASSIGNMENTS_URL}/{assignment_id}/complete"
+    submissions_url = f"{ASSIGNMENTS_URL}/{assignment_id}/submissions"
+    
     # Test assignment completion by student
     if student_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.post(f"{BASE_URL}/assignments/{assignment_id}/complete", 
+            response = requests.post(complete_url, 
                                    headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
@@ -347,7 +365,7 @@ def test_assignment_completion(student_token, teacher_token, assignment_id):
     if student_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.post(f"{BASE_URL}/assignments/{assignment_id}/complete", 
+            response = requests.post(complete_url, 
                                    headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 400:
                 results.log_success("Duplicate Completion Prevention")
@@ -360,7 +378,7 @@ def test_assignment_completion(student_token, teacher_token, assignment_id):
     if teacher_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.post(f"{BASE_URL}/assignments/{assignment_id}/complete", 
+            response = requests.post(complete_url, 
                                    headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 403:
                 results.log_success("Teacher Completion Prevention")
@@ -373,7 +391,7 @@ def test_assignment_completion(student_token, teacher_token, assignment_id):
     if teacher_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-            response = requests.get(f"{BASE_URL}/assignments/{assignment_id}/submissions", 
+            response = requests.get(submissions_url, 
                                   headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
@@ -390,7 +408,7 @@ def test_assignment_completion(student_token, teacher_token, assignment_id):
     if student_token:
         try:
             auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-            response = requests.get(f"{BASE_URL}/submissions/my", headers=auth_headers, timeout=TIMEOUT)
+            response = requests.get(MY_SUBMISSIONS_URL, headers=auth_headers, timeout=TIMEOUT)
             if response.status_code == 200:
                 data = response.json()
                 if "completed_assignments" in data and isinstance(data["completed_assignments"], list):
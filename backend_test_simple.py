@@ -1,159 +0,0 @@
-#!/usr/bin/env python3
-"""
-Simple Backend API Test for Student-Teacher Connect Application
-"""
-
-import requests
-import json
-from datetime import datetime, timedelta, timezone
-import uuid
-
-# Configuration
-BASE_URL = "https://eduassign-1.preview.emergentagent.com/api"
-HEADERS = {"Content-Type": "application/json"}
-TIMEOUT = 30
-
-def test_basic_functionality():
-    """Test basic API functionality"""
-    print("🚀 Testing Student-Teacher Connect Backend API")
-    print(f"Testing against: {BASE_URL}")
-    print("="*60)
-    
-    # Test 1: Basic API health check
-    try:
-        response = requests.get(f"{BASE_URL}/users/me", headers=HEADERS, timeout=TIMEOUT)
-        if response.status_code in [401, 403]:
-            print("✅ API is responding (unauthorized access properly rejected)")
-        else:
-            print(f"❌ Unexpected response: {response.status_code}")
-            return False
-    except Exception as e:
-        print(f"❌ API health check failed: {str(e)}")
-        return False
-    
-    # Test 2: User Registration
-    teacher_data = {
-        "name": "Dr. Sarah Johnson",
-        "email": f"sarah.johnson.{uuid.uuid4().hex[:8]}@university.edu",
-        "password": "SecurePass123!",
-        "role": "teacher"
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/auth/register", 
-                               json=teacher_data, headers=HEADERS, timeout=TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            if "access_token" in data and data["user"]["role"] == "teacher":
-                print("✅ Teacher Registration successful")
-                teacher_token = data["access_token"]
-            else:
-                print("❌ Teacher Registration: Missing token or incorrect role")
-                return False
-        else:
-            print(f"❌ Teacher Registration failed: HTTP {response.status_code}: {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Teacher Registration failed: {str(e)}")
-        return False
-    
-    # Test 3: User Login
-    try:
-        login_data = {"email": teacher_data["email"], "password": teacher_data["password"]}
-        response = requests.post(f"{BASE_URL}/auth/login", 
-                               json=login_data, headers=HEADERS, timeout=TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            if "access_token" in data:
-                print("✅ Teacher Login successful")
-                teacher_token = data["access_token"]
-            else:
-                print("❌ Teacher Login: Missing token")
-                return False
-        else:
-            print(f"❌ Teacher Login failed: HTTP {response.status_code}: {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Teacher Login failed: {str(e)}")
-        return False
-    
-    # Test 4: Assignment Creation
-    try:
-        assignment_data = {
-            "title": "Advanced Calculus Problem Set",
-            "description": "Complete problems 1-15 from Chapter 8.",
-            "subject": "Mathematics",
-            "deadline": (datetime.now(timezone.utc) + timedelta(days=7)).isoformat()
-        }
-        auth_headers = {**HEADERS, "Authorization": f"Bearer {teacher_token}"}
-        response = requests.post(f"{BASE_URL}/assignments", 
-                               json=assignment_data, headers=auth_headers, timeout=TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            if "id" in data:
-                print("✅ Assignment Creation successful")
-                assignment_id = data["id"]
-            else:
-                print("❌ Assignment Creation: Missing ID")
-                return False
-        else:
-            print(f"❌ Assignment Creation failed: HTTP {response.status_code}: {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Assignment Creation failed: {str(e)}")
-        return False
-    
-    # Test 5: Student Registration and Assignment Completion
-    student_data = {
-        "name": "Alex Chen",
-        "email": f"alex.chen.{uuid.uuid4().hex[:8]}@student.edu", 
-        "password": "StudentPass456!",
-        "role": "student"
-    }
-    
-    try:
-        response = requests.post(f"{BASE_URL}/auth/register", 
-                               json=student_data, headers=HEADERS, timeout=TIMEOUT)
-        if response.status_code == 200:
-            data = response.json()
-            if "access_token" in data and data["user"]["role"] == "student":
-                print("✅ Student Registration successful")
-                student_token = data["access_token"]
-            else:
-                print("❌ Student Registration: Missing token or incorrect role")
-                return False
-        else:
-            print(f"❌ Student Registration failed: HTTP {response.status_code}: {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Student Registration failed: {str(e)}")
-        return False
-    
-    # Test 6: Assignment Completion
-    try:
-        auth_headers = {**HEADERS, "Authorization": f"Bearer {student_token}"}
-        response = requests.post(f"{BASE_URL}/assignments/{assignment_id}/complete", 
-                               headers=auth_headers, timeout=TIMEOUT)
-        if response.status_code == 200:
-            print("✅ Assignment Completion successful")
-        else:
-            print(f"❌ Assignment Completion failed: HTTP {response.status_code}: {response.text}")
-            return False
-    except Exception as e:
-        print(f"❌ Assignment Completion failed: {str(e)}")
-        return False
-    
-    print("\n" + "="*60)
-    print("🎉 All core backend functionality tests PASSED!")
-    print("✅ User Authentication (Teacher & Student)")
-    print("✅ Assignment Management (CRUD)")
-    print("✅ Assignment Completion System")
-    print("✅ Role-based Access Control")
-    print("✅ MongoDB Integration")
-    print("="*60)
-    
-    return True
-
-if __name__ == "__main__":
-    success = test_basic_functionality()
-    exit(0 if success else 1)
\ No newline at end of file
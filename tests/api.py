@@ -0,0 +1,32 @@
+"""
+Endpoint configuration and small helpers shared by the backend API tests.
+
+Point BASE_URL at another deployment to test it, e.g.
+    BASE_URL=http://localhost:8001/api pytest tests -m smoke
+"""
+
+import itertools
+import os
+import secrets
+
+# Configuration
+BASE_URL = os.environ.get("BASE_URL", "https://eduassign-1.preview.emergentagent.com/api")
+HEADERS = {"Content-Type": "application/json"}
+TIMEOUT = 30  # Increased timeout for external API calls
+
+# Endpoint URLs, built once at import
+REGISTER_URL = f"{BASE_URL}/auth/register"
+LOGIN_URL = f"{BASE_URL}/auth/login"
+ME_URL = f"{BASE_URL}/users/me"
+ASSIGNMENTS_URL = f"{BASE_URL}/assignments"
+BULK_ASSIGNMENTS_URL = f"{BASE_URL}/assignments/bulk"
+MY_ASSIGNMENTS_URL = f"{BASE_URL}/assignments/my"
+MY_ASSIGNMENT_STATUS_URL = f"{BASE_URL}/assignments/my/status"
+MY_SUBMISSIONS_URL = f"{BASE_URL}/submissions/my"
+
+# Unique email suffixes: one random prefix per run plus a process-local counter
+_RUN_ID = secrets.token_hex(4)
+_uid = itertools.count()
+
+def unique_suffix():
+    return f"{_RUN_ID}{next(_uid):x}"
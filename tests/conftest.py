@@ -0,0 +1,104 @@
+"""
+Shared fixtures for the Student-Teacher Connect backend API tests.
+
+The teacher, student and assignment are created once per session and
+reused by every test, so a run registers each account a single time.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import orjson
+import pytest
+
+from .api import ASSIGNMENTS_URL, HEADERS, REGISTER_URL, TIMEOUT, unique_suffix
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "smoke: minimal end-to-end path (register, login, create and complete an assignment)")
+
+@pytest.fixture(scope="session")
+def anyio_backend():
+    return "asyncio"
+
+@pytest.fixture(scope="session")
+async def session_client():
+    """A single HTTP/2 connection shared by every test, so the TLS handshake is paid once"""
+    async with httpx.AsyncClient(
+        http2=True,
+        headers=HEADERS,
+        timeout=TIMEOUT,
+        limits=httpx.Limits(max_connections=1, max_keepalive_connections=1),
+    ) as client:
+        yield client
+
+@pytest.fixture(scope="session")
+async def accounts(session_client):
+    """Register the teacher and the student concurrently; each entry keeps the submitted data and the response"""
+    teacher_data = {
+        "name": "Dr. Sarah Johnson",
+        "email": f"sarah.johnson.{unique_suffix()}@university.edu",
+        "password": "SecurePass123!",
+        "role": "teacher"
+    }
+    student_data = {
+        "name": "Alex Chen",
+        "email": f"alex.chen.{unique_suffix()}@student.edu",
+        "password": "StudentPass456!",
+        "role": "student"
+    }
+    teacher_response, student_response = await asyncio.gather(
+        session_client.post(REGISTER_URL, content=orjson.dumps(teacher_data)),
+        session_client.post(REGISTER_URL, content=orjson.dumps(student_data)),
+    )
+    return (
+        {"data": teacher_data, "response": teacher_response},
+        {"data": student_data, "response": student_response},
+    )
+
+def _account(entry):
+    response = entry["response"]
+    if response.status_code != 200:
+        pytest.skip(f"{entry['data']['role']} registration failed: HTTP {response.status_code}")
+    data = orjson.loads(response.content)
+    token = data.get("access_token")
+    user_id = (data.get("user") or {}).get("id")
+    if not token or not user_id:
+        pytest.skip(f"{entry['data']['role']} registration returned no token or user")
+    # Auth headers are built once per role and reused by every request
+    return {**entry["data"], "id": user_id, "headers": {"Authorization": f"Bearer {token}"}}
+
+@pytest.fixture(scope="session")
+def teacher(accounts):
+    return _account(accounts[0])
+
+@pytest.fixture(scope="session")
+def student(accounts):
+    return _account(accounts[1])
+
+@pytest.fixture(scope="session")
+def assignment_data(student):
+    """Assigned to the session's student, who is the only one allowed to complete it"""
+    return {
+        "title": "Advanced Calculus Problem Set",
+        "description": "Complete problems 1-15 from Chapter 8. Show all work and provide detailed explanations for each solution.",
+        "subject": "Mathematics",
+        "deadline": datetime.now(timezone.utc) + timedelta(days=7),
+        "assigned_students": [student["id"]]
+    }
+
+@pytest.fixture(scope="session")
+async def assignment_response(session_client, teacher, assignment_data):
+    return await session_client.post(ASSIGNMENTS_URL, content=orjson.dumps(assignment_data), headers=teacher["headers"])
+
+@pytest.fixture(scope="session")
+def assignment(assignment_response):
+    """The teacher's assignment as returned by the API"""
+    if assignment_response.status_code != 200:
+        pytest.skip(f"Assignment creation failed: HTTP {assignment_response.status_code}")
+    return orjson.loads(assignment_response.content)
+
+@pytest.fixture(scope="session")
+async def completion_response(session_client, student, assignment):
+    """The student's first completion of the assignment; later completion checks build on it"""
+    return await session_client.post(f"{ASSIGNMENTS_URL}/{assignment['id']}/complete", headers=student["headers"])
@@ -0,0 +1,138 @@
+"""
+Unit tests for the HS256 access tokens signed in backend/server.py.
+
+These run in-process and never reach MongoDB: the authenticated-user cache
+is seeded so get_current_user can resolve a valid token without a lookup.
+"""
+
+import hashlib
+import hmac
+import os
+import sys
+import time
+import uuid
+from datetime import timedelta
+from pathlib import Path
+
+import jwt
+import orjson
+import pytest
+from fastapi import HTTPException
+from fastapi.security import HTTPAuthorizationCredentials
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "test_database")
+
+import server  # noqa: E402
+
+def _b64(data):
+    return server._b64url_encode(data).decode("ascii")
+
+def _sign(header, claims, key=server.SECRET_KEY_BYTES):
+    """Build an HS256 token by hand so individual parts can be tampered with"""
+    signing_input = f"{_b64(orjson.dumps(header))}.{_b64(orjson.dumps(claims))}".encode("ascii")
+    signature = hmac.new(key, signing_input, hashlib.sha256).digest()
+    return f"{signing_input.decode('ascii')}.{_b64(signature)}"
+
+VALID_HEADER = {"alg": "HS256", "typ": "JWT"}
+
+def _future():
+    return int(time.time()) + 600
+
+def _expired_token():
+    return server.create_access_token({"sub": str(uuid.uuid4())}, expires_delta=timedelta(seconds=-1))
+
+def _bad_signature_token():
+    return _sign(VALID_HEADER, {"sub": str(uuid.uuid4()), "exp": _future()}, key=b"some-other-secret")
+
+def _tampered_payload_token():
+    header, _, signature = server.create_access_token({"sub": str(uuid.uuid4())}).split(".")
+    payload = _b64(orjson.dumps({"sub": str(uuid.uuid4()), "exp": _future()}))
+    return f"{header}.{payload}.{signature}"
+
+def _changed_header_token():
+    # Correctly signed, but with a header this server never issues
+    return _sign({"alg": "HS256", "typ": "JWT", "kid": "1"}, {"sub": str(uuid.uuid4()), "exp": _future()})
+
+def _alg_none_token():
+    claims = {"sub": str(uuid.uuid4()), "exp": _future()}
+    return f"{_b64(orjson.dumps({'alg': 'none', 'typ': 'JWT'}))}.{_b64(orjson.dumps(claims))}."
+
+def _missing_exp_token():
+    return _sign(VALID_HEADER, {"sub": str(uuid.uuid4())})
+
+def _malformed_base64_payload_token():
+    # Correctly signed, so decoding gets as far as the payload itself
+    signing_input = f"{_b64(orjson.dumps(VALID_HEADER))}.e30!!x".encode("ascii")
+    signature = hmac.new(server.SECRET_KEY_BYTES, signing_input, hashlib.sha256).digest()
+    return f"{signing_input.decode('ascii')}.{_b64(signature)}"
+
+def _malformed_base64_signature_token():
+    header, payload, _ = server.create_access_token({"sub": str(uuid.uuid4())}).split(".")
+    return f"{header}.{payload}.a"
+
+def _not_a_token():
+    return "not-a-token"
+
+INVALID_TOKENS = {
+    "bad signature": _bad_signature_token,
+    "tampered payload": _tampered_payload_token,
+    "changed header": _changed_header_token,
+    "alg none": _alg_none_token,
+    "expired": _expired_token,
+    "missing exp": _missing_exp_token,
+    "malformed base64 payload": _malformed_base64_payload_token,
+    "malformed base64 signature": _malformed_base64_signature_token,
+    "no dots": _not_a_token,
+}
+
+# Token format
+
+def test_round_trip():
+    subject = str(uuid.uuid4())
+    token = server.create_access_token({"sub": subject}, expires_delta=timedelta(minutes=5))
+    claims = server.decode_access_token(token)
+    assert claims["sub"] == subject
+    assert isinstance(claims["exp"], int) and claims["exp"] > time.time()
+
+def test_pyjwt_token_decodes_here():
+    subject = str(uuid.uuid4())
+    token = jwt.encode({"sub": subject, "exp": _future()}, server.SECRET_KEY, algorithm=server.ALGORITHM)
+    assert server.decode_access_token(token)["sub"] == subject
+
+def test_token_decodes_with_pyjwt():
+    subject = str(uuid.uuid4())
+    token = server.create_access_token({"sub": subject})
+    claims = jwt.decode(token, server.SECRET_KEY, algorithms=[server.ALGORITHM])
+    assert claims["sub"] == subject
+
+@pytest.mark.parametrize("make_token", INVALID_TOKENS.values(), ids=INVALID_TOKENS.keys())
+def test_invalid_tokens_are_rejected(make_token):
+    with pytest.raises(ValueError):
+        server.decode_access_token(make_token())
+
+# get_current_user
+
+async def _authenticate(token):
+    return await server.get_current_user(HTTPAuthorizationCredentials(scheme="Bearer", credentials=token))
+
+@pytest.mark.anyio
+async def test_get_current_user_accepts_valid_token():
+    user = server.User(name="Alex Chen", email="alex.chen@student.edu", role="student")
+    server.user_cache[user.id] = user
+    try:
+        assert await _authenticate(server.create_access_token({"sub": str(user.id)})) is user
+    finally:
+        server.user_cache.pop(user.id, None)
+
+@pytest.mark.anyio
+@pytest.mark.parametrize("make_token", [
+    *INVALID_TOKENS.values(),
+    lambda: server.create_access_token({"name": "no subject"}),
+    lambda: server.create_access_token({"sub": "not-a-uuid"}),
+], ids=[*INVALID_TOKENS.keys(), "missing sub", "non-uuid sub"])
+async def test_get_current_user_rejects_invalid_tokens_with_401(make_token):
+    with pytest.raises(HTTPException) as excinfo:
+        await _authenticate(make_token())
+    assert excinfo.value.status_code == 401
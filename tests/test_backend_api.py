@@ -0,0 +1,245 @@
+"""
+Backend API Testing Suite for Student-Teacher Connect Application
+Tests authentication, assignment management, and role-based access control
+
+Run everything with `pytest tests`, or only the minimal end-to-end path
+with `pytest tests -m smoke`.
+"""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import orjson
+import pytest
+
+from .api import (
+    ASSIGNMENTS_URL,
+    BULK_ASSIGNMENTS_URL,
+    LOGIN_URL,
+    ME_URL,
+    MY_ASSIGNMENTS_URL,
+    MY_ASSIGNMENT_STATUS_URL,
+    MY_SUBMISSIONS_URL,
+    REGISTER_URL,
+)
+
+pytestmark = pytest.mark.anyio
+
+def _json(response):
+    return orjson.loads(response.content)
+
+def _validate_auth_teacher(data):
+    user = data.get("user") or {}
+    return bool(data.get("access_token")) and user.get("role") == "teacher"
+
+def _validate_auth_student(data):
+    user = data.get("user") or {}
+    return bool(data.get("access_token")) and user.get("role") == "student"
+
+_AUTH_VALIDATORS = {"teacher": _validate_auth_teacher, "student": _validate_auth_student}
+
+# User registration
+
+@pytest.mark.smoke
+async def test_teacher_registration(accounts):
+    response = accounts[0]["response"]
+    assert response.status_code == 200, response.text
+    assert _validate_auth_teacher(_json(response)), "Missing token or incorrect role in response"
+
+@pytest.mark.smoke
+async def test_student_registration(accounts):
+    response = accounts[1]["response"]
+    assert response.status_code == 200, response.text
+    assert _validate_auth_student(_json(response)), "Missing token or incorrect role in response"
+
+async def test_duplicate_email_prevention(session_client, teacher):
+    credentials = {key: teacher[key] for key in ("name", "email", "password", "role")}
+    response = await session_client.post(REGISTER_URL, content=orjson.dumps(credentials))
+    assert response.status_code == 400
+
+# User login
+
+@pytest.mark.parametrize("role", [pytest.param("teacher", marks=pytest.mark.smoke), "student"])
+async def test_login(session_client, request, role):
+    account = request.getfixturevalue(role)
+    response = await session_client.post(
+        LOGIN_URL, content=orjson.dumps({"email": account["email"], "password": account["password"]})
+    )
+    assert response.status_code == 200, response.text
+    assert _AUTH_VALIDATORS[role](_json(response)), "Missing token or incorrect role"
+
+async def test_invalid_credentials_rejection(session_client, teacher):
+    response = await session_client.post(
+        LOGIN_URL, content=orjson.dumps({"email": teacher["email"], "password": "wrongpassword"})
+    )
+    assert response.status_code == 401
+
+# User profile management
+
+@pytest.fixture(scope="module")
+async def profile_reads(session_client, teacher):
+    """The teacher's GET /users/me and the unauthenticated probe are independent, so they are fired together"""
+    return await asyncio.gather(
+        session_client.get(ME_URL, headers=teacher["headers"]),
+        session_client.get(ME_URL),
+    )
+
+async def test_get_teacher_profile(profile_reads):
+    response = profile_reads[0]
+    assert response.status_code == 200, response.text
+    data = _json(response)
+    assert "id" in data and "name" in data and "role" in data, "Missing required fields in response"
+
+async def test_unauthorized_profile_access_prevention(profile_reads):
+    assert profile_reads[1].status_code in (401, 403)
+
+async def test_update_user_profile(session_client, teacher, profile_reads):
+    """The PUT response is the updated profile, so it is verified directly without a follow-up GET.
+    Depends on profile_reads so the read probes see the profile before it is mutated."""
+    update_data = {
+        "name": "Dr. Sarah Johnson-Smith",
+        "theme_preference": "dark",
+        "profile_photo": "https://example.com/photo.jpg"
+    }
+    response = await session_client.put(ME_URL, content=orjson.dumps(update_data), headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    data = _json(response)
+    assert data.get("name") == update_data["name"] and data.get("theme_preference") == update_data["theme_preference"], "Profile not updated correctly"
+
+# Assignment management
+
+@pytest.mark.smoke
+async def test_assignment_creation(assignment_response, assignment_data):
+    assert assignment_response.status_code == 200, assignment_response.text
+    data = _json(assignment_response)
+    assert "id" in data and data.get("title") == assignment_data["title"], "Missing ID or incorrect title"
+
+async def test_student_assignment_access(session_client, student):
+    """The student probes don't depend on each other's responses, so they are fired together"""
+    unauthorized_assignment = {
+        "title": "Unauthorized Assignment",
+        "description": "This should not be allowed",
+        "subject": "Test",
+        "deadline": datetime.now(timezone.utc) + timedelta(days=1)
+    }
+    created, listed = await asyncio.gather(
+        session_client.post(ASSIGNMENTS_URL, content=orjson.dumps(unauthorized_assignment), headers=student["headers"]),
+        session_client.get(ASSIGNMENTS_URL, headers=student["headers"]),
+    )
+    assert created.status_code == 403, "Students must not create assignments"
+    assert listed.status_code == 200, listed.text
+    assert isinstance(_json(listed), list), "Response is not a list"
+
+async def test_get_teacher_assignments(session_client, teacher, assignment):
+    response = await session_client.get(MY_ASSIGNMENTS_URL, headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    assert isinstance(_json(response), list), "Response is not a list"
+
+async def test_get_student_assignments(session_client, student, assignment):
+    """Students get the assignments they are assigned to rather than a 403"""
+    response = await session_client.get(MY_ASSIGNMENTS_URL, headers=student["headers"])
+    assert response.status_code == 200, response.text
+    data = _json(response)
+    assert isinstance(data, list), "Response is not a list"
+    assert assignment["id"] in [item.get("id") for item in data], "Assigned assignment missing from the student's list"
+    assert all(student["id"] in item.get("assigned_students", []) for item in data), "Unassigned assignment in the student's list"
+
+def _bulk_assignment_data(count):
+    return [
+        {
+            "title": f"Weekly Reading {week}",
+            "description": f"Read chapter {week} and summarize the key arguments.",
+            "subject": "Literature",
+            "deadline": datetime.now(timezone.utc) + timedelta(weeks=week)
+        }
+        for week in range(1, count + 1)
+    ]
+
+async def test_bulk_assignment_creation(session_client, teacher):
+    bulk_data = _bulk_assignment_data(3)
+    response = await session_client.post(BULK_ASSIGNMENTS_URL, content=orjson.dumps(bulk_data), headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    data = _json(response)
+    assert [item.get("title") for item in data] == [item["title"] for item in bulk_data], "Missing or reordered assignments"
+    assert all(item.get("id") for item in data), "Missing assignment IDs"
+    assert len({item["id"] for item in data}) == len(data), "Duplicate assignment IDs"
+
+async def test_bulk_assignment_creation_empty(session_client, teacher):
+    response = await session_client.post(BULK_ASSIGNMENTS_URL, content=b"[]", headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    assert _json(response) == []
+
+async def test_student_bulk_assignment_prevention(session_client, student):
+    response = await session_client.post(
+        BULK_ASSIGNMENTS_URL, content=orjson.dumps(_bulk_assignment_data(1)), headers=student["headers"]
+    )
+    assert response.status_code == 403
+
+async def test_assignment_dates_use_utc_z(session_client, teacher, assignment):
+    """Stored documents and freshly created models serialize dates the same way"""
+    response = await session_client.get(MY_ASSIGNMENTS_URL, headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    listed = next(item for item in _json(response) if item.get("id") == assignment["id"])
+    for source in (assignment, listed):
+        assert source["deadline"].endswith("Z") and source["created_at"].endswith("Z"), "Dates not in UTC Z format"
+
+# Conditional requests
+
+# Ways a client or proxy may send the ETag back in If-None-Match
+_IF_NONE_MATCH_FORMS = {
+    "exact": lambda etag: etag,
+    "weak": lambda etag: f"W/{etag}",
+    "list": lambda etag: f'"stale", W/{etag}',
+    "wildcard": lambda etag: "*",
+}
+
+@pytest.mark.parametrize("url", [ME_URL, ASSIGNMENTS_URL], ids=["users-me", "assignments"])
+@pytest.mark.parametrize("form", _IF_NONE_MATCH_FORMS.values(), ids=_IF_NONE_MATCH_FORMS.keys())
+async def test_conditional_get_not_modified(session_client, student, assignment, url, form):
+    response = await session_client.get(url, headers=student["headers"])
+    assert response.status_code == 200, response.text
+    etag = response.headers.get("etag")
+    assert etag, "Missing ETag header"
+    revalidated = await session_client.get(url, headers={**student["headers"], "If-None-Match": form(etag)})
+    assert revalidated.status_code == 304
+    assert revalidated.content == b""
+
+async def test_conditional_get_stale_etag(session_client, student):
+    response = await session_client.get(ME_URL, headers={**student["headers"], "If-None-Match": '"stale"'})
+    assert response.status_code == 200, response.text
+    assert _json(response).get("id") == student["id"]
+
+# Assignment completion
+
+@pytest.mark.smoke
+async def test_assignment_completion(completion_response):
+    assert completion_response.status_code == 200, completion_response.text
+    assert "message" in _json(completion_response), "Missing success message"
+
+async def test_duplicate_completion_prevention(session_client, student, assignment, completion_response):
+    response = await session_client.post(f"{ASSIGNMENTS_URL}/{assignment['id']}/complete", headers=student["headers"])
+    assert response.status_code == 400
+
+async def test_teacher_completion_prevention(session_client, teacher, assignment):
+    response = await session_client.post(f"{ASSIGNMENTS_URL}/{assignment['id']}/complete", headers=teacher["headers"])
+    assert response.status_code == 403
+
+async def test_get_assignment_status(session_client, student, assignment, completion_response):
+    response = await session_client.get(MY_ASSIGNMENT_STATUS_URL, headers=student["headers"])
+    assert response.status_code == 200, response.text
+    statuses = {item.get("id"): item.get("completed") for item in _json(response)}
+    assert statuses.get(assignment["id"]) is True, "Completed assignment not reported as completed"
+
+async def test_teacher_assignment_status_prevention(session_client, teacher):
+    response = await session_client.get(MY_ASSIGNMENT_STATUS_URL, headers=teacher["headers"])
+    assert response.status_code == 403
+
+async def test_get_assignment_submissions(session_client, teacher, assignment, completion_response):
+    response = await session_client.get(f"{ASSIGNMENTS_URL}/{assignment['id']}/submissions", headers=teacher["headers"])
+    assert response.status_code == 200, response.text
+    assert isinstance(_json(response), list), "Response is not a list"
+
+async def test_get_student_submissions(session_client, student, completion_response):
+    response = await session_client.get(MY_SUBMISSIONS_URL, headers=student["headers"])
+    assert response.status_code == 200, response.text
+    assert isinstance(_json(response).get("completed_assignments"), list), "Missing or invalid completed_assignments field"